@@ -221,8 +221,7 @@ async def detect_scam(request: DetectRequest) -> DetectResponse:
         scam_type = result["scam_type"]
         confidence_scores = result["confidence_scores"]
 
-        response = DetectResponse(
-            transcript=request.transcript,
+        response = DetectResponse.build(
             is_scam=is_scam,
             scam_probability=scam_probability,
             scam_type=scam_type,
@@ -358,7 +357,7 @@ async def engage_conversation(
             logger.info("Using TTS demo mode")
             tts_result = tts.synthesize_demo(agent_response_text, mock_audio=True)
         else:
-            tts_result = tts.synthesize(agent_response_text)
+            tts_result = await tts.synthesize_async(agent_response_text, pcm16=True)
 
         # Support both legacy key `audio` and current `audio_array` returned
         # by the TTS pipeline. Be defensive and provide a clear error
@@ -385,7 +384,7 @@ async def engage_conversation(
         logger.info("TTS synthesis complete")
 
         # ---- Return Response ----
-        response = EngageResponse(
+        response = EngageResponse.build(
             session_id=session_id,
             transcript=transcript,
             agent_response_text=agent_response_text,
@@ -450,9 +449,10 @@ async def voice_detection(
 
             # Classify the audio
             logger.info(f"Classifying voice for language: {request.language}")
-            result = voice_detector.classify(audio_waveform=waveform, language=request.language)
+            result = await voice_detector.classify_async(audio_waveform=waveform, language=request.language)
 
         # Build response
+        # Validated: confidenceScore is range-checked before clients see it
         response = VoiceDetectResponse(
             language=result["language"],
             classification=result["classification"],
@@ -590,7 +590,7 @@ async def honeypot(
             )
 
         # Return response
-        response = HoneypotResponse(reply=reply_text)
+        response = HoneypotResponse.build(reply=reply_text)
 
         logger.info(f"Honeypot response generated - reply length: {len(reply_text)}")
         return response
@@ -636,15 +636,14 @@ async def extract_entities(request: ExtractRequest) -> ExtractResponse:
             logger.info("Using extractor demo mode")
             result = extractor.extract_demo(request.transcript, mock_result=True)
         else:
-            result = extractor.extract(request.transcript)
+            result = await extractor.extract_async(request.transcript)
 
         # Extract results
         entities = result["entities"]
         scammer_intelligence = result["scammer_intelligence"]
         confidence_scores = result["confidence_scores"]
 
-        response = ExtractResponse(
-            transcript=request.transcript,
+        response = ExtractResponse.build(
             entities=entities,
             scammer_intelligence=scammer_intelligence,
             confidence_scores=confidence_scores,
@@ -729,8 +728,7 @@ async def full_pipeline(
         else:
             detection_result = detector.detect(transcript)
 
-        detect_response = DetectResponse(
-            transcript=transcript,
+        detect_response = DetectResponse.build(
             is_scam=detection_result["is_scam"],
             scam_probability=detection_result["scam_probability"],
             scam_type=detection_result["scam_type"],
@@ -770,13 +768,13 @@ async def full_pipeline(
             logger.info("Using TTS demo mode")
             tts_result = tts.synthesize_demo(agent_response_text, mock_audio=True)
         else:
-            tts_result = tts.synthesize(agent_response_text)
+            tts_result = await tts.synthesize_async(agent_response_text, pcm16=True)
 
         audio_array = tts_result["audio"]
         sample_rate = tts_result["sample_rate"]
         audio_base64 = _encode_audio_to_base64(audio_array, sample_rate)
 
-        engage_response = EngageResponse(
+        engage_response = EngageResponse.build(
             session_id=session_id,
             transcript=transcript,
             agent_response_text=agent_response_text,
@@ -796,10 +794,9 @@ async def full_pipeline(
             logger.info("Using extractor demo mode")
             extraction_result = extractor.extract_demo(transcript, mock_result=True)
         else:
-            extraction_result = extractor.extract(transcript)
+            extraction_result = await extractor.extract_async(transcript)
 
-        extract_response = ExtractResponse(
-            transcript=transcript,
+        extract_response = ExtractResponse.build(
             entities=extraction_result["entities"],
             scammer_intelligence=extraction_result["scammer_intelligence"],
             confidence_scores=extraction_result["confidence_scores"],
@@ -831,7 +828,7 @@ async def full_pipeline(
         )
 
         # ---- Return Response ----
-        response = FullPipelineResponse(
+        response = FullPipelineResponse.build(
             transcript=transcript,
             scam_detection=detect_response,
             agent_response=engage_response,
@@ -25,6 +25,12 @@ class Settings(BaseSettings):
     VOICE_DETECTOR_SUPPORTED_LANGUAGES: List[str] = Field(
         default_factory=lambda: ["Tamil", "English", "Hindi", "Malayalam", "Telugu"]
     )
+    # Entity extraction settings
+    EXTRACTOR_USE_RE2: bool = Field(default=True)
+    SPACY_BATCH_SIZE: int = Field(default=64)
+    SPACY_GPU_BATCH_SIZE: int = Field(default=128)
+    # Free space scripts/download_models_safe.py requires before it starts
+    DOWNLOAD_MIN_FREE_GB: int = Field(default=5)
 
     # LLM settings
     LLM_USE_API: bool = Field(default=False)
@@ -47,8 +53,12 @@ class Settings(BaseSettings):
 
     # Runtime settings
     DEVICE: str = Field(default="cpu")
+    TORCH_COMPILE: bool = Field(default=False)
     LOG_LEVEL: str = Field(default="INFO")
     DEMO_MODE: bool = Field(default=False)
+    # Concurrent model requests are pooled and batched (see app/pipeline/request_pool.py)
+    REQUEST_POOL_MAX_BATCH: int = Field(default=8)
+    REQUEST_POOL_MAX_WAIT_MS: float = Field(default=5.0)
     # GUVI callback settings for honeypot final result reporting
     GUVI_CALLBACK_URL: str = Field(default="https://hackathon.guvi.in/api/updateHoneyPotFinalResult")
     GUVI_CALLBACK_ENABLED: bool = Field(default=True)
@@ -2,15 +2,70 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import hashlib
 import re
-from typing import Any, Dict, List, Optional
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.core.config import settings
 from app.core.logger import get_logger
 from app.models.model_loader import get_model_loader
 
+try:
+    import re2
+except Exception:  # pragma: no cover - optional dependency
+    re2 = None
+
+try:
+    import ahocorasick
+except Exception:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
 logger = get_logger("pipeline.extractor")
 
+# google-re2 matches in linear time (no backtracking); fall back to the
+# stdlib engine when it is not installed or disabled in settings.
+_USE_RE2 = re2 is not None and settings.EXTRACTOR_USE_RE2
+
+
+def _compile(pattern: str) -> Any:
+    """
+    Compile pattern with the same semantics on either engine.
+
+    RE2's \\d, \\w and \\b are ASCII-only, so the stdlib fallback is compiled
+    with re.ASCII to match: Devanagari digits are not digits, and an ASCII
+    number directly followed by a Hindi word still ends on a word boundary.
+    Patterns avoid \\s and (?i), whose ASCII sets still differ between engines.
+    """
+    if _USE_RE2:
+        return re2.compile(pattern)
+    return re.compile(pattern, re.ASCII)
+
+
+def _ignore_case(word: str) -> str:
+    """Spell out ASCII case-insensitivity, e.g. "bank" -> "[bB][aA][nN][kK]"."""
+    return "".join(f"[{c.lower()}{c.upper()}]" if c.isalpha() else re.escape(c) for c in word)
+
+
+def _build_keyword_automaton(keywords: List[str]) -> Optional[Any]:
+    """Build an Aho-Corasick automaton over keywords, if pyahocorasick is available."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex notion of a word character (ASCII, like _compile's \\w)."""
+    return char.isascii() and (char.isalnum() or char == "_")
+
 
 class EntityExtractor:
     """
@@ -22,6 +77,7 @@ class EntityExtractor:
 
     MAX_TRANSCRIPT_LENGTH = 50000
     MIN_CONFIDENCE_THRESHOLD = 0.5
+    RESULT_CACHE_SIZE = 256  # Recently seen transcripts (callback retries, dedup)
 
     ENTITY_CATEGORIES = [
         "PERSON",
@@ -33,26 +89,64 @@ class EntityExtractor:
         "CARDINAL",
         "PRODUCT",
     ]
+    # Set view for per-span membership tests; the list keeps category order
+    _ENTITY_CATEGORIES_SET = frozenset(ENTITY_CATEGORIES)
 
     # Regex patterns
-    UPI_PATTERN = re.compile(r"\b[a-zA-Z0-9._-]+@[a-zA-Z0-9]+\b")
-    PHONE_PATTERN_IN = re.compile(r"\b(\+91[-\s]?)?[6-9]\d{9}\b")
-    PHONE_PATTERN_INTL = re.compile(r"\+\d{1,3}[-\s]?\d{6,14}\b")
-    LANDLINE_PATTERN = re.compile(r"\b0\d{2,4}[-\s]?\d{6,8}\b")
-    URL_PATTERN = re.compile(
+    # Phone separators: "-" or RE2's \s set ([\t\n\f\r ]; Python's also has \v)
+    UPI_PATTERN = _compile(r"\b[a-zA-Z0-9._-]+@[a-zA-Z0-9]+\b")
+    PHONE_PATTERN_IN = _compile(r"\b(\+91[-\t\n\f\r ]?)?[6-9]\d{9}\b")
+    PHONE_PATTERN_INTL = _compile(r"\+\d{1,3}[-\t\n\f\r ]?\d{6,14}\b")
+    LANDLINE_PATTERN = _compile(r"\b0\d{2,4}[-\t\n\f\r ]?\d{6,8}\b")
+    # The three phone patterns above as one alternation, so the text is scanned once
+    PHONE_PATTERN_ANY = _compile(
+        "|".join(p.pattern for p in (PHONE_PATTERN_IN, PHONE_PATTERN_INTL, LANDLINE_PATTERN))
+    )
+    URL_PATTERN = _compile(
         r"https?://(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b(?:[-a-zA-Z0-9()@:%_\+.~#?&/=]*)"
     )
-    BANK_ACCOUNT_PATTERN = re.compile(r"\b\d{9,18}\b")
-    EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
-    IFSC_PATTERN = re.compile(r"\b[A-Z]{4}0[A-Z0-9]{6}\b")
+    BANK_ACCOUNT_PATTERN = _compile(r"\b\d{9,18}\b")
+    EMAIL_PATTERN = _compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+    IFSC_PATTERN = _compile(r"\b[A-Z]{4}0[A-Z0-9]{6}\b")
+
+    # Deletes every separator the phone patterns accept
+    _PHONE_STRIP = str.maketrans("", "", "-\t\n\f\r ")
+
+    # spaCy components that produce doc.ents; everything else is disabled
+    ENTITY_PIPES = {"ner", "entity_ruler"}
 
     BANK_CONTEXT_KEYWORDS = ["account", "ifsc", "bank", "branch", "transfer"]
+    BANK_CONTEXT_PATTERN = _compile("|".join(map(_ignore_case, BANK_CONTEXT_KEYWORDS)))
+
+    SUSPICIOUS_KEYWORDS = [
+        "urgent",
+        "verify",
+        "blocked",
+        "suspended",
+        "otp",
+        "bank",
+        "account",
+        "payment",
+        "refund",
+        "prize",
+        "winner",
+        "confirm",
+        "immediately",
+    ]
+    SUSPICIOUS_KEYWORD_PATTERN = _compile(
+        r"\b(?:" + "|".join(map(re.escape, SUSPICIOUS_KEYWORDS)) + r")\b"
+    )
+    _KEYWORD_AUTOMATON = _build_keyword_automaton(SUSPICIOUS_KEYWORDS)
 
     def __init__(self, device: Optional[str] = None) -> None:
         """Initialize EntityExtractor."""
         self.device = device or settings.DEVICE
         self.logger = get_logger("pipeline.extractor")
         self._spacy_model = None
+        self._on_gpu = False
+        self._result_cache: OrderedDict[Tuple[str, bytes], Dict[str, Any]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._last_scan: Optional[Tuple[str, Dict[str, List[str]], List[str]]] = None
 
         self.logger.info("EntityExtractor initialized")
 
@@ -62,6 +156,10 @@ class EntityExtractor:
             return
 
         try:
+            # GPU ops must be activated before the pipeline is loaded
+            if self.device.startswith("cuda"):
+                self._activate_gpu()
+
             model_loader = get_model_loader()
             self._spacy_model = model_loader.get_spacy_model()
 
@@ -71,6 +169,8 @@ class EntityExtractor:
             if not self._spacy_model.has_pipe("ner"):
                 raise RuntimeError("spaCy model missing NER pipeline")
 
+            self._disable_unused_pipes()
+
             self.logger.info("spaCy model loaded successfully")
 
         except FileNotFoundError as e:
@@ -83,65 +183,136 @@ class EntityExtractor:
             self.logger.error(f"Failed to load spaCy model: {e}")
             raise RuntimeError(f"Could not load spaCy model: {e}") from e
 
+    def _activate_gpu(self) -> None:
+        """Run spaCy on the GPU when one is available."""
+        import spacy
+
+        self._on_gpu = bool(spacy.prefer_gpu())
+        if self._on_gpu:
+            self.logger.info("spaCy NER running on GPU")
+        else:
+            self.logger.warning("CUDA requested but spaCy could not use the GPU; running on CPU")
+
+    def _disable_unused_pipes(self) -> None:
+        """Disable pipeline components that do not contribute to doc.ents."""
+        keep = set(self.ENTITY_PIPES)
+        # Keep shared embedding layers (tok2vec/transformer) the NER listens to
+        for name, component in self._spacy_model.pipeline:
+            if keep & set(getattr(component, "listening_components", ())):
+                keep.add(name)
+
+        unused = [name for name in self._spacy_model.pipe_names if name not in keep]
+        if unused:
+            self._spacy_model.select_pipes(disable=unused)
+            self.logger.info(f"Disabled unused spaCy components: {unused}")
+
     def _validate_transcript(self, transcript: str) -> None:
         """Validate transcript input."""
         if transcript is None or not isinstance(transcript, str):
             raise ValueError("Transcript must be a non-empty string")
 
-        if not transcript.strip():
-            raise ValueError("Transcript cannot be empty")
-
+        # Length check first: it is O(1), whereas strip() would copy the text
         if len(transcript) > self.MAX_TRANSCRIPT_LENGTH:
             raise ValueError(
                 f"Transcript too long ({len(transcript)} chars). "
                 f"Maximum length is {self.MAX_TRANSCRIPT_LENGTH} characters"
             )
 
+        if not transcript or transcript.isspace():
+            raise ValueError("Transcript cannot be empty")
+
+        if _USE_RE2:
+            # RE2 matches on UTF-8 bytes; lone surrogates cannot be encoded
+            try:
+                transcript.encode("utf-8")
+            except UnicodeEncodeError as e:
+                raise ValueError("Transcript must be valid UTF-8 text") from e
+
+    @staticmethod
+    def _transcript_key(transcript: str) -> bytes:
+        """Fixed-size digest identifying a transcript in the result cache."""
+        return hashlib.blake2b(transcript.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def _cache_get(self, key: Tuple[str, bytes]) -> Optional[Dict[str, Any]]:
+        """Return a private copy of a cached result, or None on a miss."""
+        with self._cache_lock:
+            result = self._result_cache.get(key)
+            if result is None:
+                return None
+            self._result_cache.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def _cache_put(self, key: Tuple[str, bytes], result: Dict[str, Any]) -> Dict[str, Any]:
+        """Store result, evicting the least recently used entry, and return a private copy."""
+        with self._cache_lock:
+            self._result_cache[key] = result
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return copy.deepcopy(result)
+
     def _deduplicate_entities(self, entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Remove duplicate entities and preserve highest confidence."""
-        seen = {}
+        best: Dict[Tuple[Any, Any, Any], Tuple[float, Dict[str, Any]]] = {}
         for ent in entities:
             key = (ent.get("text"), ent.get("start"), ent.get("end"))
-            if key not in seen or ent.get("confidence", 0) > seen[key].get("confidence", 0):
-                seen[key] = ent
-        return list(seen.values())
+            confidence = ent.get("confidence", 0)
+            prev = best.get(key)
+            if prev is None or confidence > prev[0]:
+                best[key] = (confidence, ent)
+        return [ent for _, ent in best.values()]
 
     def _normalize_phone_number(self, phone: str) -> str:
         """Normalize phone number format."""
-        normalized = re.sub(r"[\s-]", "", phone)
+        normalized = phone.translate(self._PHONE_STRIP)
         if normalized.startswith("+91"):
             return normalized
         if len(normalized) == 10 and normalized[0] in "6789":
             return "+91" + normalized
         return normalized
 
-    def _validate_bank_account(self, match: re.Match, context: str, window: int = 40) -> bool:
-        """Validate bank account number with local context keywords."""
-        start = max(match.start() - window, 0)
-        end = min(match.end() + window, len(context))
-        local_context = context[start:end].lower()
-        return any(keyword in local_context for keyword in self.BANK_CONTEXT_KEYWORDS)
-
-    def _extract_named_entities(self, transcript: str) -> Dict[str, List[Dict[str, Any]]]:
-        """Extract spaCy NER entities."""
-        self._load_model()
+    def _validate_bank_account(
+        self,
+        match: re.Match,
+        keyword_spans: List[Tuple[int, int]],
+        window: int = 40,
+    ) -> bool:
+        """Validate bank account number with local context keywords.
+
+        keyword_spans are the sorted (start, end) offsets of BANK_CONTEXT_PATTERN
+        matches in the transcript, so each check is a binary search.
+        """
+        start = match.start() - window
+        end = match.end() + window
+        # Spans don't overlap, so the first one starting in the window ends first
+        i = bisect_left(keyword_spans, (start,))
+        return i < len(keyword_spans) and keyword_spans[i][1] <= end
+
+    def _doc_entity_spans(self, doc: Any) -> List[Tuple[str, str, int, int, float]]:
+        """Copy (label, text, start, end, score) out of a spaCy Doc so it can be freed."""
+        return [
+            (ent.label_, ent.text, ent.start_char, ent.end_char, float(getattr(ent._, "score", 0.9)))
+            for ent in doc.ents
+        ]
 
-        doc = self._spacy_model(transcript)
+    def _entities_from_spans(
+        self, spans: List[Tuple[str, str, int, int, float]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Group entity spans by category, filtering by label and confidence."""
         entities: Dict[str, List[Dict[str, Any]]] = {cat: [] for cat in self.ENTITY_CATEGORIES}
 
-        for ent in doc.ents:
-            if ent.label_ not in self.ENTITY_CATEGORIES:
+        for label, text, start, end, confidence in spans:
+            if label not in self._ENTITY_CATEGORIES_SET:
                 continue
 
-            confidence = getattr(ent._, "score", 0.9)
             if confidence < self.MIN_CONFIDENCE_THRESHOLD:
                 continue
 
-            entities[ent.label_].append({
-                "text": ent.text,
-                "start": ent.start_char,
-                "end": ent.end_char,
-                "confidence": float(confidence),
+            entities[label].append({
+                "text": text,
+                "start": start,
+                "end": end,
+                "confidence": confidence,
             })
 
         # Deduplicate per category
@@ -150,24 +321,40 @@ class EntityExtractor:
 
         return entities
 
+    def _extract_named_entities(self, transcript: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Extract spaCy NER entities."""
+        self._load_model()
+
+        doc = self._spacy_model(transcript)
+        spans = self._doc_entity_spans(doc)
+        # Release the Doc (token arrays, tensors) before the regex pass runs
+        del doc
+        return self._entities_from_spans(spans)
+
     def _extract_regex_patterns(self, transcript: str) -> Dict[str, List[str]]:
         """Extract regex-based entities."""
         upi_ids = [m.group(0) for m in self.UPI_PATTERN.finditer(transcript)]
-        phone_numbers = []
-        for pattern in [self.PHONE_PATTERN_IN, self.PHONE_PATTERN_INTL, self.LANDLINE_PATTERN]:
-            for match in pattern.finditer(transcript):
-                phone_numbers.append(self._normalize_phone_number(match.group(0)))
-        phone_numbers = list(dict.fromkeys(phone_numbers))
+        phone_numbers = list(dict.fromkeys(
+            self._normalize_phone_number(m.group(0))
+            for m in self.PHONE_PATTERN_ANY.finditer(transcript)
+        ))
 
         urls = [m.group(0) for m in self.URL_PATTERN.finditer(transcript)]
         emails = [m.group(0) for m in self.EMAIL_PATTERN.finditer(transcript)]
         ifsc_codes = [m.group(0) for m in self.IFSC_PATTERN.finditer(transcript)]
 
         account_numbers = []
-        for match in self.BANK_ACCOUNT_PATTERN.finditer(transcript):
-            if self._validate_bank_account(match, transcript):
-                account_numbers.append(match.group(0))
-
+        # Locate bank-context keywords once; without any, no candidate can qualify
+        keyword_spans = [m.span() for m in self.BANK_CONTEXT_PATTERN.finditer(transcript)]
+        if keyword_spans:
+            for match in self.BANK_ACCOUNT_PATTERN.finditer(transcript):
+                # Digits right after "+" are an international phone number
+                if match.start() > 0 and transcript[match.start() - 1] == "+":
+                    continue
+                if self._validate_bank_account(match, keyword_spans):
+                    account_numbers.append(match.group(0))
+
+        # Every list is de-duplicated here; callers rely on that
         return {
             "upi_ids": list(dict.fromkeys(upi_ids)),
             "phone_numbers": phone_numbers,
@@ -188,63 +375,85 @@ class EntityExtractor:
         locations = [e["text"] for e in entities.get("GPE", [])]
         money = [e["text"] for e in entities.get("MONEY", [])]
 
+        upi_ids = patterns.get("upi_ids") or []
+        phone_numbers = patterns.get("phone_numbers") or []
+        account_numbers = patterns.get("account_numbers") or []
+
         total_entities = sum(len(v) for v in entities.values()) + sum(
             len(v) for v in patterns.values()
         )
 
         high_risk = []
-        if len(patterns.get("upi_ids", [])) > 1:
+        if len(upi_ids) > 1:
             high_risk.append("multiple_upi_ids")
 
         # Flag only truly foreign numbers (start with + but not +91)
-        foreign_phones = [p for p in patterns.get("phone_numbers", []) if p.startswith("+") and not p.startswith("+91")]
+        foreign_phones = [p for p in phone_numbers if p.startswith("+") and not p.startswith("+91")]
         if foreign_phones:
             high_risk.append("foreign_phone_number")
 
         return {
             "contact_info": {
-                "phone_numbers": patterns.get("phone_numbers", []),
-                "emails": patterns.get("emails", []),
-                "upi_ids": patterns.get("upi_ids", []),
+                "phone_numbers": phone_numbers,
+                "emails": patterns.get("emails") or [],
+                "upi_ids": upi_ids,
             },
             "payment_methods": {
-                "upi_ids": patterns.get("upi_ids", []),
-                "account_numbers": patterns.get("account_numbers", []),
-                "ifsc_codes": patterns.get("ifsc_codes", []),
+                "upi_ids": upi_ids,
+                "account_numbers": account_numbers,
+                "ifsc_codes": patterns.get("ifsc_codes") or [],
             },
             "organizations": orgs,
             "locations": locations,
             "persons": persons,
-            "urls": patterns.get("urls", []),
-            "financial_references": money + patterns.get("account_numbers", []),
+            "urls": patterns.get("urls") or [],
+            "financial_references": money + account_numbers,
             "total_entities_found": total_entities,
             "high_risk_indicators": high_risk,
         }
 
-    def _extract_suspicious_keywords(self, transcript: str) -> List[str]:
-        """Find suspicious scam-related keywords in transcript."""
-        keywords = [
-            "urgent",
-            "verify",
-            "blocked",
-            "suspended",
-            "otp",
-            "bank",
-            "account",
-            "payment",
-            "refund",
-            "prize",
-            "winner",
-            "confirm",
-            "immediately",
-        ]
+    def _extract_suspicious_keywords(self, transcript: str, lower: Optional[str] = None) -> List[str]:
+        """Find suspicious scam-related keywords in transcript.
+
+        lower may be passed in when the caller already holds transcript.lower().
+        """
+        if lower is None:
+            lower = transcript.lower()
+        if self._KEYWORD_AUTOMATON is None:
+            found = {m.group(0) for m in self.SUSPICIOUS_KEYWORD_PATTERN.finditer(lower)}
+            return list(found)
+
+        # Single pass over the text; word boundaries are checked on match offsets
         found = set()
-        lower = transcript.lower()
-        for kw in keywords:
-            if re.search(rf"\b{re.escape(kw)}\b", lower):
-                found.add(kw)
+        last = len(lower) - 1
+        for end, keyword in self._KEYWORD_AUTOMATON.iter(lower):
+            start = end - len(keyword) + 1
+            if start > 0 and _is_word_char(lower[start - 1]):
+                continue
+            if end < last and _is_word_char(lower[end + 1]):
+                continue
+            found.add(keyword)
         return list(found)
 
+    def _scan_transcript(self, transcript: str) -> Tuple[Dict[str, List[str]], List[str]]:
+        """Run the regex and keyword passes over a transcript.
+
+        extract() and get_callback_intelligence() are often called back to back
+        on the same transcript, so the most recent scan is reused. Callers get
+        fresh lists; the memoised ones end up in returned results otherwise.
+        """
+        last_scan = self._last_scan
+        if last_scan is not None and last_scan[0] == transcript:
+            patterns, keywords = last_scan[1], last_scan[2]
+        else:
+            lower = transcript.lower()
+            patterns = self._extract_regex_patterns(transcript)
+            keywords = self._extract_suspicious_keywords(transcript, lower)
+            self._last_scan = (transcript, patterns, keywords)
+
+        # Lists of str, so a shallow copy per list is a full copy
+        return {key: list(values) for key, values in patterns.items()}, list(keywords)
+
     def get_callback_intelligence(self, transcript: str) -> Dict[str, Any]:
         """Return intelligence formatted for GUVI callback payload.
 
@@ -263,21 +472,22 @@ class EntityExtractor:
                 "suspiciousKeywords": [],
             }
 
-        patterns = self._extract_regex_patterns(transcript)
+        cache_key = ("callback", self._transcript_key(transcript))
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
-        bank_accounts = patterns.get("account_numbers", [])
-        upi_ids = patterns.get("upi_ids", [])
-        phishing_links = patterns.get("urls", [])
-        phone_numbers = patterns.get("phone_numbers", [])
-        suspicious_keywords = self._extract_suspicious_keywords(transcript)
+        patterns, suspicious_keywords = self._scan_transcript(transcript)
 
-        return {
-            "bankAccounts": list(dict.fromkeys(bank_accounts)),
-            "upiIds": list(dict.fromkeys(upi_ids)),
-            "phishingLinks": list(dict.fromkeys(phishing_links)),
-            "phoneNumbers": list(dict.fromkeys(phone_numbers)),
-            "suspiciousKeywords": list(dict.fromkeys(suspicious_keywords)),
+        # Both scans return de-duplicated lists
+        result = {
+            "bankAccounts": patterns.get("account_numbers", []),
+            "upiIds": patterns.get("upi_ids", []),
+            "phishingLinks": patterns.get("urls", []),
+            "phoneNumbers": patterns.get("phone_numbers", []),
+            "suspiciousKeywords": suspicious_keywords,
         }
+        return self._cache_put(cache_key, result)
 
     def _calculate_confidence_scores(
         self,
@@ -305,23 +515,37 @@ class EntityExtractor:
 
         return scores
 
+    def _assemble_result(
+        self,
+        transcript: str,
+        entities: Dict[str, List[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Combine NER entities with regex patterns into the ExtractResponse shape."""
+        patterns, _ = self._scan_transcript(transcript)
+        intelligence = self._build_scammer_intelligence(entities, patterns)
+        confidence = self._calculate_confidence_scores(entities, patterns)
+
+        combined_entities = {**entities, **patterns}
+
+        return {
+            "entities": combined_entities,
+            "scammer_intelligence": intelligence,
+            "confidence_scores": confidence,
+        }
+
     def extract(self, transcript: str) -> Dict[str, Any]:
         """Main extraction method matching ExtractResponse schema."""
         try:
             self._validate_transcript(transcript)
 
-            entities = self._extract_named_entities(transcript)
-            patterns = self._extract_regex_patterns(transcript)
-            intelligence = self._build_scammer_intelligence(entities, patterns)
-            confidence = self._calculate_confidence_scores(entities, patterns)
-
-            combined_entities = {**entities, **patterns}
+            cache_key = ("extract", self._transcript_key(transcript))
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
 
-            return {
-                "entities": combined_entities,
-                "scammer_intelligence": intelligence,
-                "confidence_scores": confidence,
-            }
+            entities = self._extract_named_entities(transcript)
+            result = self._assemble_result(transcript, entities)
+            return self._cache_put(cache_key, result)
 
         except (ValueError, FileNotFoundError) as e:
             raise
@@ -374,10 +598,26 @@ class EntityExtractor:
         # Load model once
         self._load_model()
 
+        # Run NER over all transcripts in batches through spaCy's pipeline;
+        # larger batches keep the GPU saturated
+        batch_size = settings.SPACY_GPU_BATCH_SIZE if self._on_gpu else settings.SPACY_BATCH_SIZE
+        docs = iter(self._spacy_model.pipe(transcripts, batch_size=batch_size))
+
         results = []
         for i, transcript in enumerate(transcripts):
             try:
-                results.append(self.extract(transcript))
+                if docs is not None:
+                    try:
+                        doc = next(docs)
+                    except Exception:
+                        # A generator that raised is finished; parse the rest one by one
+                        docs = None
+                        raise
+                    entities = self._entities_from_spans(self._doc_entity_spans(doc))
+                    del doc
+                else:
+                    entities = self._extract_named_entities(transcript)
+                results.append(self._assemble_result(transcript, entities))
             except Exception as e:
                 self.logger.error(f"Batch extraction failed for index {i}: {e}")
                 results.append({
@@ -388,6 +628,14 @@ class EntityExtractor:
 
         return results
 
+    async def extract_async(self, transcript: str) -> Dict[str, Any]:
+        """Run extract() in a worker thread so async callers don't block the event loop."""
+        return await asyncio.to_thread(self.extract, transcript)
+
+    async def extract_batch_async(self, transcripts: List[str]) -> List[Dict[str, Any]]:
+        """Run extract_batch() in a worker thread, keeping nlp.pipe() batching."""
+        return await asyncio.to_thread(self.extract_batch, transcripts)
+
 
 _extractor_instance: Optional[EntityExtractor] = None
 
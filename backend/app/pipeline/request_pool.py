@@ -0,0 +1,132 @@
+"""Asyncio request pooling with dynamic batching for model calls."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Iterable, List, Optional, Set, Tuple
+
+from app.core.logger import get_logger
+
+
+class RequestPool:
+    """
+    Collect concurrent requests and hand them to a model in batches.
+
+    The first queued request opens a batch; anything else arriving within
+    ``max_wait_ms`` joins it, up to ``max_batch`` items. The batch function
+    runs in a worker thread so the event loop stays free, and yields an
+    ``(index, result)`` pair per item as soon as that item is done; each
+    caller is woken then, not when the whole batch finishes. A result that is
+    an exception is raised to that item's caller only.
+
+    Examples:
+        >>> pool = RequestPool(model.predict_batch, max_batch=8, max_wait_ms=5)
+        >>> result = await pool.submit(item)
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], Iterable[Tuple[int, Any]]],
+        max_batch: int = 8,
+        max_wait_ms: float = 5.0,
+        name: str = "default",
+    ) -> None:
+        """
+        Initialize RequestPool.
+
+        Args:
+            batch_fn: Blocking function (usually a generator) taking a list of items
+                and yielding (index into that list, result) pairs.
+            max_batch: Maximum number of items passed to batch_fn at once.
+            max_wait_ms: How long the first request waits for others to join.
+            name: Pool name used in log messages.
+        """
+        self._batch_fn = batch_fn
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.logger = get_logger(f"pipeline.request_pool.{name}")
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_worker(self) -> None:
+        """Start the batching task on the running loop if it is not already running."""
+        loop = asyncio.get_running_loop()
+        if self._worker is not None and not self._worker.done() and self._loop is loop:
+            return
+
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._worker = loop.create_task(self._run())
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Queue an item and wait for its result.
+
+        Args:
+            item: Input passed to batch_fn alongside other pooled items.
+
+        Returns:
+            The entry batch_fn produced for this item.
+
+        Raises:
+            Exception: Whatever batch_fn raised or returned for this item.
+        """
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future]]:
+        """Wait for one request, then gather more until the batch fills or the window closes."""
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch:
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        # Callers that gave up while waiting don't need a model pass
+        return [(item, future) for item, future in batch if not future.done()]
+
+    @staticmethod
+    def _settle(future: asyncio.Future, result: Any) -> None:
+        """Complete one caller's future; runs on the event loop."""
+        if future.done():
+            return
+        if isinstance(result, BaseException):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+    def _deliver(self, batch: List[Tuple[Any, asyncio.Future]], delivered: Set[int]) -> None:
+        """Run batch_fn in the worker thread, handing each result to the loop as it arrives."""
+        for index, result in self._batch_fn([item for item, _ in batch]):
+            delivered.add(index)
+            self._loop.call_soon_threadsafe(self._settle, batch[index][1], result)
+
+    async def _run(self) -> None:
+        """Batching loop: collect, run batch_fn off the loop, fail anything it left unanswered."""
+        while True:
+            batch = await self._collect()
+            if not batch:
+                continue
+
+            self.logger.debug(f"Running pooled batch of {len(batch)}")
+            # Filled in by the worker thread; read here only after it has finished
+            delivered: Set[int] = set()
+            error: BaseException = RuntimeError("Batch function returned no result for this item")
+            try:
+                await asyncio.to_thread(self._deliver, batch, delivered)
+            except Exception as e:
+                self.logger.error(f"Pooled batch failed: {e}")
+                error = e
+
+            for index, (_, future) in enumerate(batch):
+                if index not in delivered:
+                    self._settle(future, error)
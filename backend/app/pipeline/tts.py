@@ -2,24 +2,107 @@
 
 from __future__ import annotations
 
-import io
 import re
+import struct
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import librosa
 import numpy as np
 import soundfile as sf
+import torch
+
+try:
+    import torchaudio
+except Exception:  # pragma: no cover - optional dependency
+    torchaudio = None
+
+try:
+    from numba import njit
+except Exception:  # pragma: no cover - optional dependency
+    njit = None
 
 from app.core.config import settings
 from app.core.logger import get_logger
 from app.models.model_loader import get_model_loader
+from app.pipeline.request_pool import RequestPool
 
 logger = get_logger("pipeline.tts")
 
 
+@lru_cache(maxsize=8)
+def _sentence_pattern(delimiters: str) -> re.Pattern:
+    """Compile a pattern matching segments that end in one of the delimiter characters."""
+    char_class = "".join(re.escape(d) for d in delimiters)
+    return re.compile(f"[^{char_class}]*[{char_class}]|[^{char_class}]+\\Z")
+
+
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def _audio_stats_kernel(audio):  # pragma: no cover - compiled by numba
+        max_abs = 0.0
+        sum_sq = 0.0
+        for x in audio:
+            # Widen first: abs() of int16 -32768 stays negative in int16
+            value = float(x)
+            sum_sq += value * value
+            value = abs(value)
+            if value > max_abs:
+                max_abs = value
+        return max_abs, np.sqrt(sum_sq / audio.size)
+else:
+    _audio_stats_kernel = None
+
+
+def _audio_stats(audio: np.ndarray) -> Tuple[float, float]:
+    """Return (max_abs, rms) of an audio array in a single pass where possible."""
+    flat = np.ravel(audio)
+    if flat.size == 0:
+        return 0.0, 0.0
+
+    if _audio_stats_kernel is not None and flat.dtype.kind in "fiu":
+        max_abs, rms = _audio_stats_kernel(np.ascontiguousarray(flat))
+        return float(max_abs), float(rms)
+
+    if flat.dtype.kind != "f":
+        flat = flat.astype(np.float64)
+    max_abs = max(float(flat.max()), -float(flat.min()))
+    rms = float(np.sqrt(np.dot(flat, flat) / flat.size))
+    return max_abs, rms
+
+
+@lru_cache(maxsize=8)
+def _mock_silence(num_samples: int) -> np.ndarray:
+    """Shared read-only silence buffer for demo-mode synthesis."""
+    silence = np.zeros(num_samples, dtype=np.float32)
+    silence.setflags(write=False)
+    return silence
+
+
+def _to_int16(audio: np.ndarray) -> np.ndarray:
+    """Quantize float audio in [-1, 1] to PCM16 the same way libsndfile does."""
+    scaled = np.multiply(audio, 32768.0, dtype=np.float32)
+    np.clip(scaled, -32768, 32767, out=scaled)
+    return np.floor(scaled, out=scaled).astype(np.int16)
+
+
+def _pcm16_wav_bytes(audio: np.ndarray, sample_rate: int) -> bytes:
+    """Encode mono audio (float in [-1, 1] or int16) as a 16-bit PCM WAV file."""
+    pcm = audio if audio.dtype == np.int16 else _to_int16(audio)
+    pcm = pcm.astype("<i2", copy=False)
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + pcm.nbytes, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", pcm.nbytes,
+    )
+    return header + pcm.tobytes()
+
+
 class CoquiTTS:
     """
     Text-to-Speech synthesis using Coqui TTS.
@@ -40,6 +123,8 @@ class CoquiTTS:
 
     # Audio configuration
     DEFAULT_SAMPLE_RATE = 22050  # Standard TTS output rate
+    SECONDS_PER_CHAR = 0.08  # Upper-bound speech duration per character, sizes the output buffer
+    FADE_SECONDS = 0.002  # Fade applied at chunk joins to avoid clicks
     
     # Text processing limits
     MAX_TEXT_LENGTH = 5000  # Maximum characters per synthesis
@@ -48,6 +133,7 @@ class CoquiTTS:
     
     # Text splitting
     SENTENCE_DELIMITERS = ['.', '!', '?', '\n']
+    _SENTENCE_PATTERN = _sentence_pattern("".join(SENTENCE_DELIMITERS))
     
     # Language support
     SUPPORTED_LANGUAGES = ['en']
@@ -61,10 +147,21 @@ class CoquiTTS:
                    If None, uses device from settings.
         """
         self.device = device or settings.DEVICE
-        self.logger = get_logger("pipeline.tts")
+        self.logger = logger
         self._tts_model: Optional[Any] = None
+        self._loaded = False
         self._model_sample_rate: Optional[int] = None
         self._output_sample_rate_override: Optional[int] = None
+        self._resamplers: Dict[Tuple[int, int], Any] = {}
+        # Runs the next chunk's inference while the current one is post-processed
+        self._chunk_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts-chunk")
+        # Serializes synthesize_async() calls and coalesces identical concurrent texts
+        self._pool = RequestPool(
+            self._synthesize_pooled,
+            max_batch=settings.REQUEST_POOL_MAX_BATCH,
+            max_wait_ms=settings.REQUEST_POOL_MAX_WAIT_MS,
+            name="tts",
+        )
         self.sample_rate = self.DEFAULT_SAMPLE_RATE
         
         self.logger.info(f"CoquiTTS initialized with device: {self.device}")
@@ -76,7 +173,7 @@ class CoquiTTS:
         Raises:
             RuntimeError: If model loading fails.
         """
-        if self._tts_model is not None:
+        if self._loaded:
             return
 
         try:
@@ -98,7 +195,11 @@ class CoquiTTS:
                 self.sample_rate = self._model_sample_rate
             else:
                 self.sample_rate = self._output_sample_rate_override
+                self._get_resampler(self._model_sample_rate, self._output_sample_rate_override)
             
+            self._compile_model()
+
+            self._loaded = True
             self.logger.info("TTS model loaded successfully")
 
         except FileNotFoundError as e:
@@ -111,6 +212,32 @@ class CoquiTTS:
             self.logger.error(f"Failed to load TTS model: {e}")
             raise RuntimeError(f"Could not load TTS model: {e}") from e
 
+    def _compile_model(self) -> None:
+        """torch.compile the synthesizer's inference on CUDA, reverting to eager on failure."""
+        if not (settings.TORCH_COMPILE and self.device.startswith("cuda")):
+            return
+
+        tts_model = getattr(getattr(self._tts_model, "synthesizer", None), "tts_model", None)
+        if tts_model is None or not hasattr(tts_model, "inference"):
+            return
+
+        eager_inference = tts_model.inference
+        try:
+            tts_model.inference = torch.compile(eager_inference, dynamic=True)
+
+            # Warm up so compilation happens at load time, not on the first request
+            warmup_kwargs: Dict[str, Any] = {"text": "Hello."}
+            if settings.TTS_LANGUAGE:
+                warmup_kwargs["language"] = settings.TTS_LANGUAGE
+            if settings.TTS_SPEAKER is not None:
+                warmup_kwargs["speaker"] = settings.TTS_SPEAKER
+            self._tts_model.tts(**warmup_kwargs)
+
+            self.logger.info("TTS model compiled with torch.compile")
+        except Exception as e:
+            tts_model.inference = eager_inference
+            self.logger.warning(f"torch.compile failed for TTS model, using eager mode: {e}")
+
     def _validate_text(self, text: str) -> None:
         """
         Validate input text.
@@ -153,26 +280,11 @@ class CoquiTTS:
         if not delimiters:
             return [text]
 
-        # Create regex pattern that captures delimiters
-        pattern = f"([{''.join(re.escape(d) for d in delimiters)}])"
-        parts = re.split(pattern, text)
-        
-        # Reconstruct sentences with delimiters
-        sentences = []
-        current = ""
-        
-        for part in parts:
-            if not part:
-                continue
-            current += part
-            if part in delimiters:
-                sentences.append(current)
-                current = ""
-        
-        if current:
-            sentences.append(current)
-        
-        return sentences
+        if delimiters is self.SENTENCE_DELIMITERS:
+            pattern = self._SENTENCE_PATTERN
+        else:
+            pattern = _sentence_pattern("".join(delimiters))
+        return pattern.findall(text)
 
     def _chunk_text(self, text: str) -> List[str]:
         """
@@ -194,21 +306,27 @@ class CoquiTTS:
         sentences = self._split_by_delimiters(text, self.SENTENCE_DELIMITERS)
         
         chunks = []
-        current_chunk = ""
+        # Sentences of the chunk being built; joined once at each boundary
+        current: List[str] = []
+        current_len = 0
 
         for sentence in sentences:
             # If adding this sentence would exceed chunk size
-            if len(current_chunk) + len(sentence) > self.CHUNK_SIZE:
+            if current_len + len(sentence) > self.CHUNK_SIZE:
                 # Save current chunk if not empty
-                if current_chunk.strip():
-                    chunks.append(current_chunk.strip())
-                current_chunk = sentence
+                chunk = "".join(current).strip()
+                if chunk:
+                    chunks.append(chunk)
+                current = [sentence]
+                current_len = len(sentence)
             else:
-                current_chunk += sentence
+                current.append(sentence)
+                current_len += len(sentence)
 
         # Add final chunk
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+        chunk = "".join(current).strip()
+        if chunk:
+            chunks.append(chunk)
 
         self.logger.debug(f"Text chunked into {len(chunks)} segments")
         return chunks
@@ -223,18 +341,53 @@ class CoquiTTS:
         Returns:
             Normalized audio array.
         """
-        max_val = np.abs(audio_array).max()
+        max_val, _ = _audio_stats(audio_array)
         
         if max_val > 0:
+            if audio_array.dtype.kind == "f":
+                return np.divide(audio_array, max_val, out=audio_array)
             return audio_array / max_val
         
         return audio_array
 
+    def _fade_chunk_edges(
+        self, segment: np.ndarray, sample_rate: int, fade_in: bool, fade_out: bool
+    ) -> None:
+        """Apply short linear fades in place at the edges of a chunk."""
+        n = min(int(sample_rate * self.FADE_SECONDS), len(segment) // 2)
+        if n <= 0:
+            return
+
+        ramp = np.linspace(0.0, 1.0, n, dtype=np.float32)
+        if fade_in:
+            segment[:n] *= ramp
+        if fade_out:
+            segment[-n:] *= ramp[::-1]
+
+    def _get_resampler(self, orig_rate: int, target_rate: int) -> Optional[Any]:
+        """Return a cached torchaudio resampler, or None if torchaudio is unavailable."""
+        if torchaudio is None or orig_rate == target_rate:
+            return None
+
+        key = (orig_rate, target_rate)
+        resampler = self._resamplers.get(key)
+        if resampler is None:
+            resampler = torchaudio.transforms.Resample(orig_freq=orig_rate, new_freq=target_rate)
+            self._resamplers[key] = resampler
+        return resampler
+
     def _resample_audio(self, audio_array: np.ndarray, target_rate: int) -> np.ndarray:
         """Resample audio to target sample rate if needed."""
         if self._model_sample_rate is None or self._model_sample_rate == target_rate:
             return audio_array
-        return librosa.resample(audio_array, orig_sr=self._model_sample_rate, target_sr=target_rate)
+
+        resampler = self._get_resampler(self._model_sample_rate, target_rate)
+        if resampler is None:
+            return librosa.resample(audio_array, orig_sr=self._model_sample_rate, target_sr=target_rate)
+
+        waveform = torch.from_numpy(np.ascontiguousarray(audio_array, dtype=np.float32)).unsqueeze(0)
+        with torch.inference_mode():
+            return resampler(waveform).squeeze(0).numpy()
 
     def synthesize(
         self,
@@ -243,6 +396,7 @@ class CoquiTTS:
         language: Optional[str] = None,
         speaker: Optional[Union[str, int]] = None,
         speaker_wav: Optional[Path] = None,
+        pcm16: bool = False,
     ) -> Dict[str, Any]:
         """
         Synthesize speech from text.
@@ -253,10 +407,13 @@ class CoquiTTS:
             language: Optional language code (defaults to settings.TTS_LANGUAGE).
             speaker: Optional speaker ID/name (if supported by model).
             speaker_wav: Optional path to a reference speaker WAV (if supported).
+            pcm16: If True, return int16 samples instead of float32. Use when the
+                audio is only going to be written out as 16-bit PCM.
             
         Returns:
             Dictionary containing:
                 - audio_array: NumPy array of audio samples
+                - dtype: Sample dtype of audio_array ("float32" or "int16")
                 - sample_rate: Sample rate in Hz
                 - duration_seconds: Audio duration
                 - output_path: File path (if saved)
@@ -296,33 +453,52 @@ class CoquiTTS:
                 if self._tts_model.speakers and resolved_speaker not in self._tts_model.speakers:
                     raise ValueError(f"Unknown speaker: {resolved_speaker}")
 
-            # Synthesize each chunk
-            audio_segments = []
-            for i, chunk in enumerate(chunks):
+            tts_kwargs: Dict[str, Any] = {}
+            if lang:
+                tts_kwargs["language"] = lang
+            if resolved_speaker is not None:
+                tts_kwargs["speaker"] = resolved_speaker
+            if speaker_wav is not None:
+                tts_kwargs["speaker_wav"] = str(speaker_wav)
+
+            # Synthesize each chunk straight into one pre-sized output buffer,
+            # keeping the next chunk's inference in flight meanwhile
+            model_rate = self._model_sample_rate or self.sample_rate
+            audio_array = np.empty(int(len(text) * model_rate * self.SECONDS_PER_CHAR), dtype=np.float32)
+            write_idx = 0
+            last = len(chunks) - 1
+            pending = self._chunk_executor.submit(self._tts_model.tts, text=chunks[0], **tts_kwargs)
+            for i in range(len(chunks)):
                 self.logger.debug(f"Synthesizing chunk {i+1}/{len(chunks)}")
-                
-                # Generate audio for chunk
-                tts_kwargs: Dict[str, Any] = {"text": chunk}
-                if lang:
-                    tts_kwargs["language"] = lang
-                if resolved_speaker is not None:
-                    tts_kwargs["speaker"] = resolved_speaker
-                if speaker_wav is not None:
-                    tts_kwargs["speaker_wav"] = str(speaker_wav)
-
-                chunk_audio = self._tts_model.tts(**tts_kwargs)
-                
-                # Convert to numpy array if needed
-                if not isinstance(chunk_audio, np.ndarray):
-                    chunk_audio = np.array(chunk_audio)
-                
-                audio_segments.append(chunk_audio)
 
-            # Concatenate all segments
-            if len(audio_segments) > 1:
-                audio_array = np.concatenate(audio_segments)
+                chunk_audio = pending.result()
+                if i < last:
+                    pending = self._chunk_executor.submit(
+                        self._tts_model.tts, text=chunks[i + 1], **tts_kwargs
+                    )
+
+                chunk_audio = np.asarray(chunk_audio, dtype=np.float32)
+                end_idx = write_idx + len(chunk_audio)
+
+                # Grow the buffer only if the estimate was too small
+                if end_idx > len(audio_array):
+                    grown = np.empty(max(end_idx, 2 * len(audio_array)), dtype=np.float32)
+                    grown[:write_idx] = audio_array[:write_idx]
+                    audio_array = grown
+
+                audio_array[write_idx:end_idx] = chunk_audio
+                if last > 0:
+                    self._fade_chunk_edges(
+                        audio_array[write_idx:end_idx], model_rate, fade_in=i > 0, fade_out=i < last
+                    )
+                write_idx = end_idx
+
+            # A slice would keep the whole buffer alive (up to 2x after a grow);
+            # copy out when more than an eighth of it is unused
+            if write_idx < len(audio_array) - len(audio_array) // 8:
+                audio_array = audio_array[:write_idx].copy()
             else:
-                audio_array = audio_segments[0]
+                audio_array = audio_array[:write_idx]
 
             # Normalize audio
             audio_array = self._normalize_audio(audio_array)
@@ -332,6 +508,10 @@ class CoquiTTS:
                 audio_array = self._resample_audio(audio_array, self._output_sample_rate_override)
                 self.sample_rate = self._output_sample_rate_override
 
+            # No float processing remains; quantize before writing
+            if pcm16:
+                audio_array = _to_int16(audio_array)
+
             # Save to file if requested
             if output_path:
                 output_path = Path(output_path)
@@ -350,6 +530,7 @@ class CoquiTTS:
 
             return {
                 "audio_array": audio_array,
+                "dtype": str(audio_array.dtype),
                 "sample_rate": self.sample_rate,
                 "duration_seconds": float(duration),
                 "output_path": str(output_path) if output_path else None,
@@ -366,6 +547,48 @@ class CoquiTTS:
             self.logger.error(f"Synthesis failed: {e}", exc_info=True)
             raise RuntimeError(f"TTS synthesis error: {e}") from e
 
+    def _synthesize_pooled(self, requests: List[Tuple[str, bool]]) -> Iterator[Tuple[int, Any]]:
+        """
+        Request pool batch function: synthesize (text, pcm16) requests in turn.
+
+        The model has no batched entry point, so requests run one after another
+        and each is yielded as soon as it is done; identical requests in the
+        same batch are synthesized once. Failures are yielded in place of the
+        result so only that caller sees them.
+        """
+        done: Dict[Tuple[str, bool], Any] = {}
+
+        for index, request in enumerate(requests):
+            if request in done:
+                previous = done[request]
+                if not isinstance(previous, Exception):
+                    previous = dict(previous, audio_array=previous["audio_array"].copy())
+                yield index, previous
+                continue
+
+            try:
+                result = self.synthesize(request[0], pcm16=request[1])
+            except Exception as e:
+                result = e
+            done[request] = result
+            yield index, result
+
+    async def synthesize_async(self, text: str, pcm16: bool = False) -> Dict[str, Any]:
+        """
+        Synthesize speech through the request pool.
+
+        Concurrent callers share one worker, so the event loop is never blocked
+        and the model is never entered from two threads at once.
+
+        Args:
+            text: Text to synthesize.
+            pcm16: If True, return int16 samples (see synthesize).
+
+        Returns:
+            Synthesis result dictionary (see synthesize).
+        """
+        return await self._pool.submit((text, pcm16))
+
     def synthesize_to_file(
         self,
         text: str,
@@ -388,7 +611,7 @@ class CoquiTTS:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        return self.synthesize(text, output_path)
+        return self.synthesize(text, output_path, pcm16=True)
 
     def synthesize_to_bytes(self, text: str) -> bytes:
         """
@@ -412,15 +635,10 @@ class CoquiTTS:
         """
         try:
             # Synthesize without saving to file
-            result = self.synthesize(text)
+            result = self.synthesize(text, pcm16=True)
             audio_array = result["audio_array"]
             
-            # Create in-memory WAV file
-            buffer = io.BytesIO()
-            sf.write(buffer, audio_array, self.sample_rate, format='WAV')
-            
-            # Get bytes
-            audio_bytes = buffer.getvalue()
+            audio_bytes = _pcm16_wav_bytes(audio_array, self.sample_rate)
             self.logger.debug(f"Generated {len(audio_bytes)} bytes of audio")
             
             return audio_bytes
@@ -507,8 +725,13 @@ class CoquiTTS:
                 - is_clipping: Whether audio is clipping
         """
         duration = len(audio_array) / self.sample_rate
-        max_amplitude = float(np.abs(audio_array).max())
-        rms_level = float(np.sqrt(np.mean(audio_array ** 2)))
+        max_amplitude, rms_level = _audio_stats(audio_array)
+        is_clipping = max_amplitude >= 1.0
+        if audio_array.dtype == np.int16:
+            # Report PCM16 levels on the same [-1, 1] scale as float audio
+            is_clipping = max_amplitude >= 32767
+            max_amplitude /= 32768.0
+            rms_level /= 32768.0
 
         return {
             "duration_seconds": float(duration),
@@ -516,7 +739,7 @@ class CoquiTTS:
             "num_samples": len(audio_array),
             "max_amplitude": max_amplitude,
             "rms_level": rms_level,
-            "is_clipping": max_amplitude >= 1.0,
+            "is_clipping": is_clipping,
         }
 
     def synthesize_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
@@ -545,11 +768,19 @@ class CoquiTTS:
 
         results = []
         success_count = 0
+        # Repeated texts within a batch are synthesized once
+        synthesized: Dict[str, Dict[str, Any]] = {}
         
         for i, text in enumerate(texts):
             try:
-                self.logger.debug(f"Synthesizing batch item {i+1}/{len(texts)}")
-                result = self.synthesize(text)
+                previous = synthesized.get(text) if isinstance(text, str) else None
+                if previous is not None:
+                    self.logger.debug(f"Reusing audio for repeated batch item {i+1}/{len(texts)}")
+                    result = dict(previous, audio_array=previous["audio_array"].copy())
+                else:
+                    self.logger.debug(f"Synthesizing batch item {i+1}/{len(texts)}")
+                    result = self.synthesize(text)
+                    synthesized[text] = result
                 results.append(result)
                 success_count += 1
 
@@ -558,6 +789,7 @@ class CoquiTTS:
                 # Append error result
                 results.append({
                     "audio_array": None,
+                    "dtype": None,
                     "sample_rate": self.sample_rate,
                     "duration_seconds": 0.0,
                     "output_path": None,
@@ -598,11 +830,12 @@ class CoquiTTS:
         if settings.DEMO_MODE and mock_audio:
             self.logger.info("Returning mock audio (demo mode)")
             
-            # Generate 2 seconds of silence as mock audio
-            mock_audio_array = np.zeros(int(self.sample_rate * 2.0))
+            # 2 seconds of silence as mock audio (shared, read-only)
+            mock_audio_array = _mock_silence(int(self.sample_rate * 2.0))
             
             return {
                 "audio_array": mock_audio_array,
+                "dtype": str(mock_audio_array.dtype),
                 "sample_rate": self.sample_rate,
                 "duration_seconds": 2.0,
                 "output_path": None,
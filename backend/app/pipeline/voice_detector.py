@@ -2,21 +2,33 @@
 
 from __future__ import annotations
 
-import base64
+import asyncio
+import binascii
 import io
-import tempfile
+import random
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
+import librosa
 import numpy as np
+import soundfile as sf
 import torch
 
+try:
+    import torchaudio
+except Exception:  # pragma: no cover - optional dependency
+    torchaudio = None
+
 from app.core.config import settings
 from app.core.logger import get_logger
 from app.models.model_loader import get_model_loader
+from app.pipeline.request_pool import RequestPool
 
 logger = get_logger("pipeline.voice_detector")
 
+# libsndfile decodes MPEG audio from 1.1.0 on; the soundfile wheels bundle it
+_MP3_SUPPORTED = "MP3" in sf.available_formats()
+
 
 class VoiceDetector:
     """
@@ -30,52 +42,100 @@ class VoiceDetector:
 
     def __init__(self, device: Optional[str] = None) -> None:
         self.device = device or settings.DEVICE
-        self.logger = get_logger("pipeline.voice_detector")
+        self.logger = logger
         self._model: Optional[Any] = None
         self._processor: Optional[Any] = None
+        self._loaded = False
+        self._resamplers: Dict[Tuple[int, int], Any] = {}
+        # Concurrent classify_async() calls of equal waveform length share a forward pass
+        self._pool = RequestPool(
+            self._classify_groups,
+            max_batch=settings.REQUEST_POOL_MAX_BATCH,
+            max_wait_ms=settings.REQUEST_POOL_MAX_WAIT_MS,
+            name="voice_detector",
+        )
         # Initialize supported languages from configuration
         self.supported_languages = getattr(settings, "VOICE_DETECTOR_SUPPORTED_LANGUAGES", ["Tamil", "English", "Hindi", "Malayalam", "Telugu"])
         self.logger.info(f"VoiceDetector initialized with device: {self.device}")
 
     def _load_model(self) -> None:
-        if self._model is not None and self._processor is not None:
+        if self._loaded:
             return
 
         try:
             self.logger.info("Loading voice detector model...")
             model_loader = get_model_loader()
             self._model, self._processor = model_loader.get_voice_detector_model()
+            self._loaded = self._model is not None and self._processor is not None
+            if self._loaded:
+                self._compile_model()
             self.logger.info("Voice detector model loaded successfully")
         except Exception as e:
             self.logger.error(f"Failed to load voice detector model: {e}")
             raise RuntimeError(f"Could not load voice detector model: {e}") from e
 
+    def _compile_model(self) -> None:
+        """torch.compile the classifier on CUDA, reverting to eager on failure."""
+        if not (settings.TORCH_COMPILE and self.device.startswith("cuda")):
+            return
+
+        eager_model = self._model
+        try:
+            self._model = torch.compile(eager_model, dynamic=True)
+            # Warm up with one second of silence so compilation happens at load time
+            self._predict([np.zeros(self.SAMPLE_RATE, dtype=np.float32)])
+            self.logger.info("Voice detector model compiled with torch.compile")
+        except Exception as e:
+            self._model = eager_model
+            self.logger.warning(f"torch.compile failed for voice detector model, using eager mode: {e}")
+
     def _validate_language(self, language: str) -> None:
         if language not in self.supported_languages:
             raise ValueError(
                 f"Unsupported language: {language}. Supported languages: {', '.join(self.supported_languages)}"
             )
 
+    def _resample(self, waveform: np.ndarray, orig_rate: int) -> np.ndarray:
+        """Resample a mono waveform to SAMPLE_RATE with a cached torchaudio transform."""
+        if orig_rate == self.SAMPLE_RATE:
+            return waveform
+
+        if torchaudio is None:
+            return librosa.resample(waveform, orig_sr=orig_rate, target_sr=self.SAMPLE_RATE)
+
+        key = (orig_rate, self.SAMPLE_RATE)
+        resampler = self._resamplers.get(key)
+        if resampler is None:
+            resampler = torchaudio.transforms.Resample(orig_freq=orig_rate, new_freq=self.SAMPLE_RATE)
+            self._resamplers[key] = resampler
+
+        with torch.inference_mode():
+            return resampler(torch.from_numpy(waveform).unsqueeze(0)).squeeze(0).numpy()
+
+    def _load_audio(self, source: Union[str, Path, io.BytesIO]) -> Tuple[np.ndarray, int]:
+        """Read audio as mono float32 at SAMPLE_RATE."""
+        data, sr = sf.read(source, dtype="float32", always_2d=False)
+        if data.ndim > 1:
+            data = data.mean(axis=1, dtype=np.float32)
+        return self._resample(np.ascontiguousarray(data), sr), self.SAMPLE_RATE
+
     def decode_base64_mp3(self, audio_base64: str) -> np.ndarray:
         try:
-            audio_bytes = base64.b64decode(audio_base64)
+            # a2b_base64 takes str or bytes directly; b64decode would re-encode str first
+            audio_bytes = binascii.a2b_base64(audio_base64)
 
-            import librosa
+            if not _MP3_SUPPORTED:
+                raise ValueError(
+                    f"libsndfile {sf.__libsndfile_version__} cannot decode MP3; libsndfile >= 1.1.0 is required"
+                )
 
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp_file:
-                tmp_file.write(audio_bytes)
-                tmp_path = tmp_file.name
+            waveform, sr = self._load_audio(io.BytesIO(audio_bytes))
+            if waveform is None or len(waveform) == 0:
+                raise ValueError("Decoded audio is empty")
+            self.logger.debug(f"Decoded audio: {len(waveform)} samples at {sr}Hz")
+            return waveform
 
-            try:
-                waveform, sr = librosa.load(tmp_path, sr=self.SAMPLE_RATE, mono=True)
-                if waveform is None or len(waveform) == 0:
-                    raise ValueError("Decoded audio is empty")
-                self.logger.debug(f"Decoded audio: {len(waveform)} samples at {sr}Hz")
-                return waveform
-            finally:
-                Path(tmp_path).unlink(missing_ok=True)
-
-        except base64.binascii.Error as e:
+        except binascii.Error as e:
             raise ValueError(f"Invalid base64 encoding: {e}") from e
         except Exception as e:
             self.logger.error(f"Failed to decode audio: {e}")
@@ -97,19 +157,78 @@ class VoiceDetector:
             else:
                 return f"Likely human voice in {language}. Predominantly natural speech patterns."
 
-    def classify(self, audio_path: Optional[str] = None, audio_waveform: Optional[np.ndarray] = None, language: str = "English") -> Dict[str, Any]:
-        self._validate_language(language)
-        self._load_model()
-
+    def _check_sources(self, audio_path: Optional[str], audio_waveform: Optional[np.ndarray]) -> None:
         if audio_path is None and audio_waveform is None:
             raise ValueError("Either audio_path or audio_waveform must be provided")
         if audio_path is not None and audio_waveform is not None:
             raise ValueError("Provide only one of audio_path or audio_waveform")
 
+    def _predict(
+        self, waveforms: List[np.ndarray], return_confidence: bool = True
+    ) -> List[Tuple[int, Optional[float]]]:
+        """Run the classifier over one or more waveforms; returns (class, confidence) per input.
+
+        Waveforms must all have the same length: the model gets no attention
+        mask, so padding would change the result. With return_confidence=False
+        the softmax is skipped and confidence is None.
+        """
+        batch = waveforms[0] if len(waveforms) == 1 else waveforms
+        inputs = self._processor(batch, sampling_rate=self.SAMPLE_RATE, return_tensors="pt")
+        use_cuda = self.device.startswith("cuda")
+        if use_cuda:
+            # Pinned host memory lets the copies run asynchronously ahead of the forward pass
+            inputs = {k: v.pin_memory().to(self.device, non_blocking=True) for k, v in inputs.items()}
+        else:
+            inputs = {k: v.to(self.device) for k, v in inputs.items()}
+
+        # fp16 autocast on GPU only; CPU bf16 autocast is slower than fp32 on most hosts
+        with torch.inference_mode(), torch.autocast(device_type="cuda", dtype=torch.float16, enabled=use_cuda):
+            logits = self._model(**inputs).logits.float()
+            # softmax is monotonic, so argmax over the logits picks the same class
+            predicted = torch.argmax(logits, dim=-1, keepdim=True)
+            if not return_confidence:
+                return [(label, None) for label in predicted.squeeze(-1).tolist()]
+            confidences = torch.softmax(logits, dim=-1).gather(-1, predicted).squeeze(-1)
+
+        return list(zip(predicted.squeeze(-1).tolist(), confidences.tolist()))
+
+    def _build_result(self, predicted_class: int, confidence: Optional[float], language: str) -> Dict[str, Any]:
+        classification = self.LABEL_MAPPING.get(predicted_class, "HUMAN")
+
+        if confidence is None:
+            self.logger.info(f"Classification: {classification}, language={language}")
+            return {
+                "classification": classification,
+                "confidence": None,
+                "explanation": None,
+                "language": language,
+            }
+
+        explanation = self._generate_explanation(classification, confidence, language)
+
+        result = {
+            "classification": classification,
+            "confidence": float(confidence),
+            "explanation": explanation,
+            "language": language,
+        }
+
+        self.logger.info(f"Classification: {classification}, confidence={confidence:.3f}, language={language}")
+        return result
+
+    def classify(self, audio_path: Optional[str] = None, audio_waveform: Optional[np.ndarray] = None, language: str = "English", return_confidence: bool = True) -> Dict[str, Any]:
+        """Classify a voice sample as AI_GENERATED or HUMAN.
+
+        Callers that only route on the label can pass return_confidence=False to
+        skip the softmax; confidence and explanation are then None.
+        """
+        self._validate_language(language)
+        self._load_model()
+        self._check_sources(audio_path, audio_waveform)
+
         try:
             if audio_path is not None:
-                import librosa
-                waveform, sr = librosa.load(audio_path, sr=self.SAMPLE_RATE, mono=True)
+                waveform, sr = self._load_audio(audio_path)
             else:
                 waveform = audio_waveform
 
@@ -118,37 +237,81 @@ class VoiceDetector:
 
             self.logger.debug(f"Processing audio: {len(waveform)} samples, language={language}")
 
-            inputs = self._processor(waveform, sampling_rate=self.SAMPLE_RATE, return_tensors="pt", padding=True)
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
+            (predicted_class, confidence), = self._predict([waveform], return_confidence)
+            return self._build_result(predicted_class, confidence, language)
 
-            with torch.no_grad():
-                outputs = self._model(**inputs)
-                logits = outputs.logits
-                probabilities = torch.nn.functional.softmax(logits, dim=-1)
-                predicted_class = torch.argmax(probabilities, dim=-1).item()
-                confidence = probabilities[0][predicted_class].item()
+        except Exception as e:
+            self.logger.error(f"Voice classification failed: {e}", exc_info=True)
+            raise RuntimeError(f"Voice classification error: {e}") from e
 
-            classification = self.LABEL_MAPPING.get(predicted_class, "HUMAN")
-            explanation = self._generate_explanation(classification, confidence, language)
+    def classify_batch(self, requests: List[Tuple[np.ndarray, str]]) -> List[Any]:
+        """
+        Classify several (waveform, language) pairs, one forward pass per waveform length.
+
+        Only equal-length waveforms share a pass, so each result matches what
+        classify() returns for that waveform alone. Returns a result dict per
+        request, or the exception raised for that request's pass.
+        """
+        results: List[Any] = [None] * len(requests)
+        for index, result in self._classify_groups(requests):
+            results[index] = result
+        return results
+
+    def _classify_groups(self, requests: List[Tuple[np.ndarray, str]]) -> Iterator[Tuple[int, Any]]:
+        """
+        Yield (index, result) for each request as soon as its length group is classified.
+
+        Also the request pool's batch function, so pooled callers are woken
+        group by group rather than after the whole batch.
+        """
+        try:
+            self._load_model()
+        except Exception as e:
+            self.logger.error(f"Voice classification failed: {e}", exc_info=True)
+            error = RuntimeError(f"Voice classification error: {e}")
+            for index in range(len(requests)):
+                yield index, error
+            return
 
-            result = {
-                "classification": classification,
-                "confidence": float(confidence),
-                "explanation": explanation,
-                "language": language,
-            }
+        by_length: Dict[int, List[int]] = {}
+        for index, (waveform, _) in enumerate(requests):
+            by_length.setdefault(len(waveform), []).append(index)
 
-            self.logger.info(f"Classification: {classification}, confidence={confidence:.3f}, language={language}")
-            return result
+        for indices in by_length.values():
+            try:
+                self.logger.debug(f"Processing pooled batch of {len(indices)} waveforms")
+                predictions = self._predict([requests[i][0] for i in indices])
+            except Exception as e:
+                self.logger.error(f"Voice classification failed: {e}", exc_info=True)
+                error = RuntimeError(f"Voice classification error: {e}")
+                for i in indices:
+                    yield i, error
+                continue
+
+            for i, (predicted_class, confidence) in zip(indices, predictions):
+                yield i, self._build_result(predicted_class, confidence, requests[i][1])
+
+    async def classify_async(self, audio_path: Optional[str] = None, audio_waveform: Optional[np.ndarray] = None, language: str = "English") -> Dict[str, Any]:
+        """Classify via the request pool so concurrent calls are batched together."""
+        self._validate_language(language)
+        self._check_sources(audio_path, audio_waveform)
 
-        except Exception as e:
-            self.logger.error(f"Voice classification failed: {e}", exc_info=True)
-            raise RuntimeError(f"Voice classification error: {e}") from e
+        if audio_path is not None:
+            try:
+                waveform, _ = await asyncio.to_thread(self._load_audio, audio_path)
+            except Exception as e:
+                raise RuntimeError(f"Voice classification error: {e}") from e
+        else:
+            waveform = audio_waveform
+
+        if waveform is None or len(waveform) == 0:
+            raise RuntimeError("Voice classification error: Audio waveform is empty")
+
+        return await self._pool.submit((waveform, language))
 
     def classify_demo(self, audio_path: Optional[str] = None, audio_waveform: Optional[np.ndarray] = None, language: str = "English", mock_result: bool = False) -> Dict[str, Any]:
         if settings.DEMO_MODE and mock_result:
             self.logger.info("Returning mock voice detection result (demo mode)")
-            import random
             is_ai = random.choice([True, False])
             if is_ai:
                 return {
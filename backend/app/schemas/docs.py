@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict
+
+
+def field_descriptions(**descriptions: str) -> Callable[[Dict[str, Any]], None]:
+    """Build a json_schema_extra hook that adds field descriptions to a model's schema.
+
+    A plain dict in json_schema_extra would replace "properties" wholesale, so
+    the descriptions are merged into the generated properties instead.
+    """
+
+    def add_descriptions(schema: Dict[str, Any]) -> None:
+        properties = schema.get("properties", {})
+        for name, description in descriptions.items():
+            prop = properties.get(name)
+            if prop is None:
+                continue
+            if "$ref" in prop:
+                # Same shape pydantic emits for a described model reference
+                prop["allOf"] = [{"$ref": prop.pop("$ref")}]
+            prop["description"] = description
+
+    return add_descriptions
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
-from pathlib import Path
+import os.path
 from typing import Dict, List, Optional
 
 from fastapi import UploadFile
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
-_ALLOWED_AUDIO_EXTENSIONS = {".wav", ".mp3", ".m4a", ".flac", ".ogg"}
+from app.schemas.docs import field_descriptions
+
+_ALLOWED_AUDIO_EXTENSIONS = frozenset({".wav", ".mp3", ".m4a", ".flac", ".ogg"})
+_ALLOWED_LANGUAGES = frozenset({"Tamil", "English", "Hindi", "Malayalam", "Telugu"})
+_LANGUAGE_ERROR = f"Language must be one of: {', '.join(sorted(_ALLOWED_LANGUAGES))}"
+_MP3 = "mp3"
+
+
+def _check_audio_suffix(filename: Optional[str]) -> None:
+    suffix = os.path.splitext(filename)[1].lower() if filename else ""
+    if suffix and suffix not in _ALLOWED_AUDIO_EXTENSIONS:
+        raise ValueError("Unsupported audio format")
 
 
 class DetectRequest(BaseModel):
@@ -25,11 +36,8 @@ class EngageRequest(BaseModel):
     @field_validator("audio")
     @classmethod
     def _validate_audio_extension(cls, value: Optional[UploadFile]):
-        if value is None:
-            return value
-        suffix = Path(value.filename).suffix.lower() if value.filename else ""
-        if suffix and suffix not in _ALLOWED_AUDIO_EXTENSIONS:
-            raise ValueError("Unsupported audio format")
+        if value is not None:
+            _check_audio_suffix(value.filename)
         return value
 
     @model_validator(mode="after")
@@ -53,54 +61,74 @@ class FullPipelineRequest(BaseModel):
     @field_validator("audio")
     @classmethod
     def _validate_audio_extension(cls, value: UploadFile):
-        suffix = Path(value.filename).suffix.lower() if value.filename else ""
-        if suffix and suffix not in _ALLOWED_AUDIO_EXTENSIONS:
-            raise ValueError("Unsupported audio format")
+        _check_audio_suffix(value.filename)
         return value
 
 
 class VoiceDetectRequest(BaseModel):
     """Request model for PS1 voice detection endpoint."""
-    language: str = Field(..., description="One of: Tamil, English, Hindi, Malayalam, Telugu")
-    audioFormat: str = Field(..., description="Audio format (must be 'mp3')")
-    audioBase64: str = Field(..., min_length=1, description="Base64-encoded MP3 audio")
+    language: str
+    audioFormat: str
+    audioBase64: str = Field(..., min_length=1)
+
+    model_config = ConfigDict(json_schema_extra=field_descriptions(
+        language="One of: Tamil, English, Hindi, Malayalam, Telugu",
+        audioFormat="Audio format (must be 'mp3')",
+        audioBase64="Base64-encoded MP3 audio",
+    ))
 
     @field_validator("language")
     @classmethod
     def validate_language(cls, v: str) -> str:
-        allowed = {"Tamil", "English", "Hindi", "Malayalam", "Telugu"}
-        if v not in allowed:
-            raise ValueError(f"Language must be one of: {', '.join(allowed)}")
+        if v not in _ALLOWED_LANGUAGES:
+            raise ValueError(_LANGUAGE_ERROR)
         return v
 
     @field_validator("audioFormat")
     @classmethod
     def validate_format(cls, v: str) -> str:
-        if v.lower() != "mp3":
+        v_lower = v.lower()
+        if v_lower != _MP3:
             raise ValueError("audioFormat must be 'mp3'")
-        return v.lower()
+        return v_lower
 
 
 class HoneypotMessage(BaseModel):
     """Single message in honeypot conversation."""
-    sender: str = Field(..., description="'scammer' or 'user'")
-    text: str = Field(..., min_length=1, description="Message content")
-    timestamp: int = Field(..., description="Epoch time in milliseconds")
+    sender: str
+    text: str = Field(..., min_length=1)
+    timestamp: int
+
+    # Read-only once parsed; extra keys from callers are still ignored
+    model_config = ConfigDict(frozen=True, json_schema_extra=field_descriptions(
+        sender="'scammer' or 'user'",
+        text="Message content",
+        timestamp="Epoch time in milliseconds",
+    ))
 
 
 class HoneypotMetadata(BaseModel):
     """Optional metadata for honeypot request."""
-    channel: Optional[str] = Field(None, description="SMS, WhatsApp, Email, Chat")
-    language: Optional[str] = Field(None, description="Language used")
-    locale: Optional[str] = Field(None, description="Country/region code")
+    channel: Optional[str] = None
+    language: Optional[str] = None
+    locale: Optional[str] = None
+
+    model_config = ConfigDict(json_schema_extra=field_descriptions(
+        channel="SMS, WhatsApp, Email, Chat",
+        language="Language used",
+        locale="Country/region code",
+    ))
 
 
 class HoneypotRequest(BaseModel):
     """Request model for PS2 honeypot endpoint."""
-    sessionId: str = Field(..., min_length=1, description="Unique session identifier")
-    message: HoneypotMessage = Field(..., description="Latest incoming message")
-    conversationHistory: List[HoneypotMessage] = Field(
-        default_factory=list,
-        description="Previous messages in conversation",
-    )
+    sessionId: str = Field(..., min_length=1)
+    message: HoneypotMessage
+    conversationHistory: List[HoneypotMessage] = Field(default_factory=list)
     metadata: Optional[HoneypotMetadata] = None
+
+    model_config = ConfigDict(json_schema_extra=field_descriptions(
+        sessionId="Unique session identifier",
+        message="Latest incoming message",
+        conversationHistory="Previous messages in conversation",
+    ))
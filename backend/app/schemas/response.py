@@ -1,24 +1,74 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Type, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from typing_extensions import TypedDict
 
 from app.core.config import utcnow
+from app.schemas.docs import field_descriptions
+
+ResponseT = TypeVar("ResponseT", bound="BaseResponse")
+
+
+class IntelligenceItem(TypedDict):
+    """One piece of intelligence the agent picked up during a conversation."""
+    type: str
+    value: str
+    confidence: float
+
+
+class ContactInfo(TypedDict, total=False):
+    phone_numbers: List[str]
+    emails: List[str]
+    upi_ids: List[str]
+
+
+class PaymentMethods(TypedDict, total=False):
+    upi_ids: List[str]
+    account_numbers: List[str]
+    ifsc_codes: List[str]
+
+
+class ScammerIntelligence(TypedDict, total=False):
+    """Aggregated intelligence from EntityExtractor; empty when extraction fails."""
+    contact_info: ContactInfo
+    payment_methods: PaymentMethods
+    organizations: List[str]
+    locations: List[str]
+    persons: List[str]
+    urls: List[str]
+    financial_references: List[str]
+    total_entities_found: int
+    high_risk_indicators: List[str]
 
 
 class BaseResponse(BaseModel):
+    # Built once per request and only serialized; subclasses inherit this config
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     status: str = Field(default="success")
     message: Optional[str] = None
     timestamp: datetime = Field(default_factory=utcnow)
 
+    @classmethod
+    def build(cls: Type[ResponseT], **data: Any) -> ResponseT:
+        """Build a response from trusted server-side values without validating them.
+
+        Defaults are still applied, but nothing else checks the values later:
+        FastAPI serializes a returned model instance as-is, so field types,
+        constraints and extra="forbid" are not enforced. Use the normal
+        constructor for anything from a client or with constrained fields.
+        """
+        return cls.model_construct(**data)
+
 
 class DetectResponse(BaseResponse):
     is_scam: bool
     scam_probability: float
     scam_type: Optional[str] = None
-    confidence_scores: Dict
+    confidence_scores: Dict[str, float]
 
 
 class EngageResponse(BaseResponse):
@@ -28,13 +78,14 @@ class EngageResponse(BaseResponse):
     session_id: str
     turn_number: int
     terminated: bool = False
-    extracted_intelligence: Optional[List[Dict[str, Any]]] = None
+    extracted_intelligence: Optional[List[IntelligenceItem]] = None
 
 
 class ExtractResponse(BaseResponse):
-    entities: Dict
-    scammer_intelligence: Dict
-    confidence_scores: Dict
+    # NER labels map to entity dicts, regex categories to plain strings
+    entities: Dict[str, List[Any]]
+    scammer_intelligence: ScammerIntelligence
+    confidence_scores: Dict[str, float]
 
 
 class FullPipelineResponse(BaseResponse):
@@ -49,20 +100,30 @@ class FullPipelineResponse(BaseResponse):
 class VoiceDetectResponse(BaseResponse):
     """Response model for PS1 voice detection endpoint."""
     language: str
-    classification: str = Field(..., description="AI_GENERATED or HUMAN")
-    confidenceScore: float = Field(..., ge=0.0, le=1.0, description="Confidence between 0.0 and 1.0")
-    explanation: str = Field(..., description="Reason for the classification")
+    classification: str
+    confidenceScore: float = Field(..., ge=0.0, le=1.0)
+    explanation: str
+
+    model_config = ConfigDict(json_schema_extra=field_descriptions(
+        classification="AI_GENERATED or HUMAN",
+        confidenceScore="Confidence between 0.0 and 1.0",
+        explanation="Reason for the classification",
+    ))
 
 
 class ErrorResponse(BaseModel):
     """Generic error response for all endpoints."""
     status: str = Field(default="error")
-    message: str = Field(..., description="Error message")
+    message: str
+
+    model_config = ConfigDict(json_schema_extra=field_descriptions(message="Error message"))
 
 
 class HoneypotResponse(BaseResponse):
     """Response model for PS2 honeypot endpoint."""
-    reply: str = Field(..., description="Agent's response text")
+    reply: str
+
+    model_config = ConfigDict(json_schema_extra=field_descriptions(reply="Agent's response text"))
 
 
 class ExtractedIntelligence(BaseModel):
@@ -1,12 +1,19 @@
-"""Safe model download script - downloads one at a time to avoid OOM."""
+"""Safe model download script - runs each download in its own process, a few at a time, to avoid OOM."""
 
 from __future__ import annotations
 
+import argparse
+import json
+import multiprocessing
+import shutil
 import subprocess
 import sys
 import time
 import gc
+from functools import partial
+from multiprocessing.connection import wait
 from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
@@ -15,6 +22,71 @@ from app.core.logger import get_logger
 
 logger = get_logger("scripts.download_models_safe")
 
+# Weights for other frameworks; the app only loads the PyTorch ones
+HF_IGNORE_PATTERNS = ["*.h5", "*.msgpack", "*.ot", "*.onnx", "onnx/*", "*.tflite", "coreml/*"]
+
+GB = 1 << 30
+
+# Written into the Transformers and TTS model directories after a successful
+# download: {model name: revision}
+MANIFEST_NAME = ".honeycomb_manifest.json"
+
+
+def read_manifest(model_dir: Path) -> Dict[str, Optional[str]]:
+    """Return the download manifest for a model directory, or {} if there is none."""
+    try:
+        return json.loads((model_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def write_manifest(model_dir: Path, model_name: str, revision: Optional[str] = None) -> None:
+    """Record that model_name (at revision, if known) is fully downloaded into model_dir."""
+    manifest = read_manifest(model_dir)
+    manifest[model_name] = revision
+    (model_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+
+def download_hf_snapshot(repo_id: str, target_dir: Path) -> bool:
+    """
+    Stream a Hugging Face repo straight to disk without building the model.
+
+    Returns:
+        False if target_dir already holds the repo's current revision, True otherwise
+    """
+    from huggingface_hub import HfApi, snapshot_download
+
+    manifest = read_manifest(target_dir)
+    have_files = (target_dir / "config.json").exists() and (
+        any(target_dir.glob("*.safetensors")) or any(target_dir.glob("*.bin"))
+    )
+    have_local = repo_id in manifest and have_files
+    try:
+        info = HfApi().model_info(repo_id)
+    except Exception as e:
+        if not have_local:
+            raise
+        logger.warning(f"Could not check {repo_id} for updates, keeping local copy: {e}")
+        return False
+
+    if have_local and manifest[repo_id] == info.sha:
+        return False
+
+    ignore_patterns = list(HF_IGNORE_PATTERNS)
+    if any(sibling.rfilename.endswith(".safetensors") for sibling in info.siblings or []):
+        # Same weights twice; from_pretrained prefers safetensors
+        ignore_patterns.append("*.bin")
+
+    snapshot_download(
+        repo_id=repo_id,
+        revision=info.sha,
+        local_dir=str(target_dir),
+        local_dir_use_symlinks=False,
+        ignore_patterns=ignore_patterns,
+    )
+    write_manifest(target_dir, repo_id, info.sha)
+    return True
+
 
 def download_whisper_model() -> bool:
     """Download Whisper ASR model."""
@@ -24,51 +96,58 @@ def download_whisper_model() -> bool:
         
         whisper_dir = settings.MODELS_DIR / "whisper"
         whisper_dir.mkdir(parents=True, exist_ok=True)
-        
+
+        if settings.WHISPER_MODEL_NAME not in whisper._MODELS:
+            logger.error(f"✗ Unknown Whisper model: {settings.WHISPER_MODEL_NAME}")
+            return False
+
+        # whisper's own downloader streams to disk and checks the SHA256, and
+        # skips the fetch when an existing checkpoint matches; load_model would
+        # also build the whole model in RAM
         start_time = time.time()
-        model = whisper.load_model(
-            settings.WHISPER_MODEL_NAME,
-            download_root=str(whisper_dir)
-        )
+        checkpoint = Path(whisper._download(
+            whisper._MODELS[settings.WHISPER_MODEL_NAME],
+            str(whisper_dir),
+            in_memory=False,
+        ))
         elapsed = time.time() - start_time
-        
-        if model is not None:
-            logger.info(f"✓ Whisper model downloaded successfully in {elapsed:.2f}s")
-            # Force garbage collection to free memory
-            del model
-            gc.collect()
+
+        if checkpoint.is_file():
+            size_mb = checkpoint.stat().st_size / (1024 ** 2)
+            logger.info(f"✓ Whisper model downloaded successfully in {elapsed:.2f}s ({size_mb:.0f}MB)")
             return True
         else:
-            logger.error("✗ Whisper model download returned None")
+            logger.error(f"✗ Whisper checkpoint missing after download: {checkpoint}")
             return False
-            
+
     except Exception as e:
         logger.error(f"✗ Failed to download Whisper model: {e}")
         return False
 
 
-def download_distilbert_model() -> bool:
+def download_distilbert_model(verify: bool = False) -> bool:
     """Download NLI-compatible model for zero-shot classification."""
     try:
         logger.info(f"Downloading NLI model: {settings.DISTILBERT_MODEL_NAME}")
-        from transformers import AutoModelForSequenceClassification, AutoTokenizer
-        
+
         distilbert_dir = settings.distilbert_model_path
         distilbert_dir.mkdir(parents=True, exist_ok=True)
-        
+
         start_time = time.time()
-        model = AutoModelForSequenceClassification.from_pretrained(
-            settings.DISTILBERT_MODEL_NAME
-        )
-        tokenizer = AutoTokenizer.from_pretrained(settings.DISTILBERT_MODEL_NAME)
-        
-        model.save_pretrained(str(distilbert_dir))
-        tokenizer.save_pretrained(str(distilbert_dir))
+        downloaded = download_hf_snapshot(settings.DISTILBERT_MODEL_NAME, distilbert_dir)
         elapsed = time.time() - start_time
-        
-        logger.info(f"✓ NLI model downloaded in {elapsed:.2f}s")
-        del model, tokenizer
-        gc.collect()
+
+        if verify:
+            from transformers import AutoModelForSequenceClassification
+
+            model = AutoModelForSequenceClassification.from_pretrained(str(distilbert_dir))
+            del model
+            gc.collect()
+
+        if downloaded:
+            logger.info(f"✓ NLI model downloaded in {elapsed:.2f}s")
+        else:
+            logger.info("✓ NLI model already up to date")
         return True
         
     except (OSError, Exception) as e:
@@ -83,34 +162,28 @@ def download_spacy_model() -> bool:
         import spacy
         
         start_time = time.time()
-        
-        try:
-            model = spacy.load(settings.SPACY_MODEL_NAME)
+
+        # is_package only looks up the installed distribution; spacy.load would
+        # read the whole pipeline into memory just to prove it exists
+        if spacy.util.is_package(settings.SPACY_MODEL_NAME):
             logger.info("✓ spaCy model already installed")
-            del model
-            gc.collect()
             return True
-        except OSError:
-            pass
-        
+
         result = subprocess.run(
             [sys.executable, "-m", "spacy", "download", settings.SPACY_MODEL_NAME],
             capture_output=True,
             text=True,
             check=False
         )
-        
+
         if result.returncode != 0:
             logger.error(f"✗ spaCy download failed: {result.stderr}")
             return False
-        
-        model = spacy.load(settings.SPACY_MODEL_NAME)
+
         elapsed = time.time() - start_time
-        
-        if model is not None:
+
+        if spacy.util.is_package(settings.SPACY_MODEL_NAME):
             logger.info(f"✓ spaCy model downloaded and verified in {elapsed:.2f}s")
-            del model
-            gc.collect()
             return True
         else:
             logger.error("✗ spaCy model verification failed")
@@ -126,11 +199,22 @@ def download_tts_model() -> bool:
     try:
         import os
         logger.info(f"Downloading TTS model: {settings.TTS_MODEL_NAME}")
-        from TTS.api import TTS
+        try:
+            from TTS.api import TTS
+        except ImportError as e:
+            logger.error(f"✗ Coqui TTS is not installed (pip install coqui-tts): {e}")
+            return False
         
         tts_dir = settings.MODELS_DIR / "tts"
         tts_dir.mkdir(parents=True, exist_ok=True)
-        
+
+        # Coqui keeps each model under $TTS_HOME/tts/<name with / replaced by -->
+        model_dir = tts_dir / "tts" / settings.TTS_MODEL_NAME.replace("/", "--")
+        have_files = (model_dir / "config.json").is_file() and any(model_dir.glob("*.pth"))
+        if settings.TTS_MODEL_NAME in read_manifest(tts_dir) and have_files:
+            logger.info("✓ TTS model already downloaded")
+            return True
+
         os.environ["TTS_HOME"] = str(tts_dir)
         
         start_time = time.time()
@@ -139,6 +223,7 @@ def download_tts_model() -> bool:
         
         if tts is not None:
             logger.info(f"✓ TTS model downloaded successfully in {elapsed:.2f}s")
+            write_manifest(tts_dir, settings.TTS_MODEL_NAME)
             del tts
             gc.collect()
             return True
@@ -151,7 +236,7 @@ def download_tts_model() -> bool:
         return False
 
 
-def download_llm_model() -> bool:
+def download_llm_model(verify: bool = False) -> bool:
     """Download LLM model for local inference."""
     if settings.LLM_USE_API:
         logger.info("LLM_USE_API enabled; skipping local LLM download")
@@ -159,22 +244,25 @@ def download_llm_model() -> bool:
 
     try:
         logger.info(f"Downloading LLM model: {settings.LLM_MODEL_NAME}")
-        from transformers import AutoModelForCausalLM, AutoTokenizer
 
         llm_dir = settings.llm_model_path
         llm_dir.mkdir(parents=True, exist_ok=True)
 
         start_time = time.time()
-        model = AutoModelForCausalLM.from_pretrained(settings.LLM_MODEL_NAME)
-        tokenizer = AutoTokenizer.from_pretrained(settings.LLM_MODEL_NAME)
-
-        model.save_pretrained(str(llm_dir))
-        tokenizer.save_pretrained(str(llm_dir))
+        downloaded = download_hf_snapshot(settings.LLM_MODEL_NAME, llm_dir)
         elapsed = time.time() - start_time
 
-        logger.info(f"✓ LLM model downloaded in {elapsed:.2f}s")
-        del model, tokenizer
-        gc.collect()
+        if verify:
+            from transformers import AutoModelForCausalLM
+
+            model = AutoModelForCausalLM.from_pretrained(str(llm_dir))
+            del model
+            gc.collect()
+
+        if downloaded:
+            logger.info(f"✓ LLM model downloaded in {elapsed:.2f}s")
+        else:
+            logger.info("✓ LLM model already up to date")
         return True
 
     except Exception as e:
@@ -182,26 +270,29 @@ def download_llm_model() -> bool:
         return False
 
 
-def download_voice_detector_model() -> bool:
+def download_voice_detector_model(verify: bool = False) -> bool:
     """Download voice deepfake detection model."""
     try:
         logger.info(f"Downloading voice detector model: {settings.VOICE_DETECTOR_MODEL_NAME}")
-        from transformers import AutoModelForAudioClassification, Wav2Vec2Processor
 
         voice_detector_dir = settings.voice_detector_model_path
         voice_detector_dir.mkdir(parents=True, exist_ok=True)
 
         start_time = time.time()
-        model = AutoModelForAudioClassification.from_pretrained(settings.VOICE_DETECTOR_MODEL_NAME)
-        processor = Wav2Vec2Processor.from_pretrained(settings.VOICE_DETECTOR_MODEL_NAME)
-
-        model.save_pretrained(str(voice_detector_dir))
-        processor.save_pretrained(str(voice_detector_dir))
+        downloaded = download_hf_snapshot(settings.VOICE_DETECTOR_MODEL_NAME, voice_detector_dir)
         elapsed = time.time() - start_time
 
-        logger.info(f"✓ Voice detector model downloaded in {elapsed:.2f}s")
-        del model, processor
-        gc.collect()
+        if verify:
+            from transformers import AutoModelForAudioClassification
+
+            model = AutoModelForAudioClassification.from_pretrained(str(voice_detector_dir))
+            del model
+            gc.collect()
+
+        if downloaded:
+            logger.info(f"✓ Voice detector model downloaded in {elapsed:.2f}s")
+        else:
+            logger.info("✓ Voice detector model already up to date")
         return True
 
     except Exception as e:
@@ -212,15 +303,14 @@ def download_voice_detector_model() -> bool:
 def check_disk_space() -> bool:
     """Check if sufficient disk space is available."""
     try:
-        import shutil
         stats = shutil.disk_usage(settings.MODELS_DIR.parent)
-        free_gb = stats.free / (1024 ** 3)
-        
-        if free_gb < 5:
-            logger.error(f"✗ Insufficient disk space: {free_gb:.2f}GB free (5GB required)")
+        required = settings.DOWNLOAD_MIN_FREE_GB
+
+        if stats.free < required * GB:
+            logger.error(f"✗ Insufficient disk space: {stats.free / GB:.2f}GB free ({required}GB required)")
             return False
         
-        logger.info(f"✓ Disk space check passed: {free_gb:.2f}GB available")
+        logger.info(f"✓ Disk space check passed: {stats.free / GB:.2f}GB available")
         return True
         
     except Exception as e:
@@ -228,10 +318,71 @@ def check_disk_space() -> bool:
         return True
 
 
+# Downloads are network-bound, but each worker may still hold a model in RAM
+MAX_PARALLEL_DOWNLOADS = 2
+
+
+def _download_worker(download_func: Callable[[], bool]) -> None:
+    """Child process entry point; exit code 0 means the download succeeded."""
+    sys.exit(0 if download_func() else 1)
+
+
+def run_downloads(models: List[Tuple[str, Callable[[], bool]]]) -> Dict[str, bool]:
+    """
+    Run each download in its own process, at most MAX_PARALLEL_DOWNLOADS at once.
+
+    A separate process per download means a worker killed by the OOM killer
+    fails only its own model; everything else still runs.
+
+    Returns:
+        Success flag per model name, in the order of models
+    """
+    # Spawned workers start clean and import only the libraries their download
+    # function needs, so no torch state is inherited from the parent
+    mp_context = multiprocessing.get_context("spawn")
+    pending = list(models)
+    running = {}
+    results = {}
+
+    while pending or running:
+        while pending and len(running) < MAX_PARALLEL_DOWNLOADS:
+            model_name, download_func = pending.pop(0)
+            process = mp_context.Process(
+                target=_download_worker, args=(download_func,), name=f"download-{model_name}"
+            )
+            process.start()
+            running[process.sentinel] = (model_name, process)
+            logger.info(f"Started download: {model_name}")
+
+        for sentinel in wait(list(running)):
+            model_name, process = running.pop(sentinel)
+            process.join()
+            results[model_name] = process.exitcode == 0
+            if process.exitcode not in (0, 1):
+                # Negative exit codes are signals, e.g. -9 from the OOM killer
+                logger.error(f"✗ {model_name} download worker died (exit code {process.exitcode})")
+            logger.info(f"Finished: {model_name}")
+
+    return {model_name: results[model_name] for model_name, _ in models}
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Download all Honeycomb models.")
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Load each Transformers model after download to check it (uses much more RAM)",
+    )
+    return parser.parse_args()
+
+
 def main() -> None:
-    """Main execution function - downloads models one at a time."""
+    """Main execution function - downloads models in separate worker processes."""
+    args = parse_args()
+
     logger.info("=" * 60)
-    logger.info("Starting SAFE model download process (one at a time)")
+    logger.info(f"Starting SAFE model download process ({MAX_PARALLEL_DOWNLOADS} at a time)")
     logger.info("=" * 60)
     
     settings.MODELS_DIR.mkdir(parents=True, exist_ok=True)
@@ -240,29 +391,18 @@ def main() -> None:
     if not check_disk_space():
         sys.exit(1)
     
-    # Download models one by one
+    # Independent downloads; a worker process returns all of its memory on exit
     models = [
         ("whisper", download_whisper_model),
-        ("distilbert", download_distilbert_model),
+        ("distilbert", partial(download_distilbert_model, verify=args.verify)),
         ("spacy", download_spacy_model),
         ("tts", download_tts_model),
-        ("llm", download_llm_model),
-        ("voice_detector", download_voice_detector_model),
+        ("llm", partial(download_llm_model, verify=args.verify)),
+        ("voice_detector", partial(download_voice_detector_model, verify=args.verify)),
     ]
     
-    results = {}
-    for model_name, download_func in models:
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Downloading: {model_name}")
-        logger.info(f"{'='*60}")
-        
-        success = download_func()
-        results[model_name] = success
-        
-        # Wait between downloads to allow memory cleanup
-        logger.info(f"Waiting 5 seconds before next model...")
-        time.sleep(5)
-    
+    results = run_downloads(models)
+
     # Summary
     logger.info("\n" + "=" * 60)
     logger.info("Download Summary")
@@ -0,0 +1,91 @@
+"""Pin the regex semantics of EntityExtractor so they don't depend on google-re2 being installed."""
+
+import importlib
+
+import pytest
+
+extractor = pytest.importorskip("app.pipeline.extractor")
+from app.core.config import settings
+
+
+@pytest.fixture(params=[True, False], ids=["re2", "stdlib"])
+def engine(request):
+    """Reload the extractor module with RE2 enabled or disabled."""
+    if request.param and extractor.re2 is None:
+        pytest.skip("google-re2 is not installed")
+
+    original = settings.EXTRACTOR_USE_RE2
+    settings.EXTRACTOR_USE_RE2 = request.param
+    try:
+        module = importlib.reload(extractor)
+        assert module._USE_RE2 is request.param
+        yield module
+    finally:
+        settings.EXTRACTOR_USE_RE2 = original
+        importlib.reload(extractor)
+
+
+@pytest.fixture(params=["automaton", "regex"])
+def keyword_extractor(request, engine, monkeypatch):
+    """EntityExtractor using the Aho-Corasick keyword scan or the regex fallback."""
+    if request.param == "automaton" and engine.EntityExtractor._KEYWORD_AUTOMATON is None:
+        pytest.skip("pyahocorasick is not installed")
+    if request.param == "regex":
+        monkeypatch.setattr(engine.EntityExtractor, "_KEYWORD_AUTOMATON", None)
+    return engine.EntityExtractor()
+
+
+def test_non_ascii_digits_are_not_identifiers(engine):
+    patterns = engine.EntityExtractor()._extract_regex_patterns("खाता १२३४५६७८९०१२ bank ९८७६५४३२१०")
+
+    assert patterns["account_numbers"] == []
+    assert patterns["phone_numbers"] == []
+
+
+def test_ascii_number_next_to_hindi_word_is_extracted(engine):
+    ext = engine.EntityExtractor()
+
+    assert ext._extract_regex_patterns("कॉल 9876543210पर")["phone_numbers"] == ["+919876543210"]
+    assert ext._extract_regex_patterns("bank 123456789012खाता")["account_numbers"] == ["123456789012"]
+
+
+def test_phone_separators_are_stripped(engine):
+    patterns = engine.EntityExtractor()._extract_regex_patterns("call +91 9876543210 or +91-9123456789")
+
+    assert sorted(patterns["phone_numbers"]) == ["+919123456789", "+919876543210"]
+
+
+def test_keywords_next_to_non_ascii_letters(keyword_extractor):
+    found = keyword_extractor._extract_suspicious_keywords("bankखाता urgentम éotp verify_me")
+
+    assert sorted(found) == ["bank", "otp", "urgent"]
+
+
+class _FailingPipeModel:
+    """spaCy stand-in whose pipe() generator raises on one transcript."""
+
+    def __init__(self, bad: str):
+        self.bad = bad
+
+    def _doc(self, text):
+        if text == self.bad:
+            raise ValueError("parse failed")
+        return type("Doc", (), {"ents": ()})()
+
+    def __call__(self, text):
+        return self._doc(text)
+
+    def pipe(self, texts, batch_size=None):
+        for text in texts:
+            yield self._doc(text)
+
+
+def test_batch_items_after_a_pipe_failure_are_still_extracted():
+    ext = extractor.EntityExtractor()
+    ext._spacy_model = _FailingPipeModel(bad="second")
+
+    results = ext.extract_batch(["first", "second", "pay to scam@upi", "call 9876543210"])
+
+    assert results[1]["entities"] == {}
+    assert results[2]["entities"]["upi_ids"] == ["scam@upi"]
+    assert results[3]["entities"]["phone_numbers"] == ["+919876543210"]